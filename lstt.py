@@ -1,33 +1,33 @@
 #!/usr/bin/env python3
 """lstt - Push-to-talk speech transcription for Linux/Wayland."""
 
+import argparse
 import os
+import queue
+import selectors
 import signal
 import subprocess
 import sys
 import threading
+import time
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
-
-
 import evdev
 import gi
 import numpy as np
 import sounddevice as sd
-from faster_whisper import WhisperModel
+import soxr
+from gi.repository import GLib
 
-gi.require_version("Gdk", "3.0")
-gi.require_version("Gtk", "3.0")
-from gi.repository import Gdk, GLib, Gtk
 
-try:
-    gi.require_version("GtkLayerShell", "0.1")
-    from gi.repository import GtkLayerShell
-    HAS_LAYER_SHELL = GtkLayerShell.is_supported()
-except (ValueError, ImportError):
-    HAS_LAYER_SHELL = False
+def load_gtk():
+    """Import Gtk on first use; startup paths that never show UI don't pay for it."""
+    gi.require_version("Gdk", "3.0")
+    gi.require_version("Gtk", "3.0")
+    from gi.repository import Gtk
+    return Gtk
 
 
 def notify(title: str, message: str = "", urgency: str = "normal"):
@@ -42,20 +42,98 @@ def notify(title: str, message: str = "", urgency: str = "normal"):
         pass  # Notification failed, continue silently
 
 # Configuration
-WHISPER_MODEL = "small.en"
+CPU_THREADS = int(os.environ.get("LSTT_THREADS", max(1, (os.cpu_count() or 2) // 2)))
+# CTranslate2 reads OMP_NUM_THREADS when faster_whisper is imported (in Transcriber).
+os.environ.setdefault("OMP_NUM_THREADS", str(CPU_THREADS))
+WHISPER_MODEL = os.environ.get("LSTT_MODEL", "distil-small.en")
+COMPUTE_TYPE = os.environ.get("LSTT_COMPUTE_TYPE", "int8_float32")
+BEAM_SIZE = int(os.environ.get("LSTT_BEAM", "1"))
+LANGUAGE = "en"
 SAMPLE_RATE = 16000
 CHANNELS = 1
+MAX_RECORD_SECONDS = 60
 LOW_CONFIDENCE_LOGPROB = -1.0
 HIGH_NO_SPEECH_PROB = 0.6
+MIN_RMS = float(os.environ.get("LSTT_MIN_RMS", "0.005"))
+TRIM_LEVEL = 0.01  # RMS level below which trailing 10ms windows are trimmed
+TRIM_WINDOW = SAMPLE_RATE // 100
+TRIM_PAD = SAMPLE_RATE // 10
+# Transcribe while recording in chunks at least this long. Every chunk costs a full
+# 30s-window encoder pass, so short chunks only add work.
+CHUNK_SECONDS = float(os.environ.get("LSTT_CHUNK_SECONDS", "10"))
+CHUNK_POLL = 0.25
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     text: str
     avg_logprob: float
     no_speech_prob: float
     duration: float
     timestamp: str
+    low_confidence: bool = field(init=False)
+    formatted: str = field(init=False)  # History line, built once so printing history is cheap
+
+    def __post_init__(self):
+        self.low_confidence = (
+            self.avg_logprob < LOW_CONFIDENCE_LOGPROB
+            or self.no_speech_prob > HIGH_NO_SPEECH_PROB
+        )
+        confidence = "!" if self.low_confidence else " "
+        self.formatted = f"  [{self.timestamp}] {confidence} ({self.duration:.1f}s) {self.text}"
+
+    @classmethod
+    def merge(cls, parts: list["TranscriptionResult"]) -> "TranscriptionResult":
+        """Combine the results of consecutive (trimmed) chunks of one recording."""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        duration = sum(p.duration for p in parts)
+        spoken = [p for p in parts if p.text]
+        if not spoken:
+            return cls("", 0.0, 1.0, duration, timestamp)
+        return cls(
+            " ".join(p.text for p in spoken),
+            sum(p.avg_logprob for p in spoken) / len(spoken),
+            max(p.no_speech_prob for p in spoken),
+            duration,
+            timestamp,
+        )
+
+
+def measure_and_trim(audio: np.ndarray) -> tuple[np.ndarray, float]:
+    """Return the clip with trailing silence trimmed, and the RMS of the whole clip.
+
+    Both come from one pass of per-window energies; trimming keeps a short pad
+    after the last 10ms window above TRIM_LEVEL.
+    """
+    if len(audio) == 0:
+        return audio, 0.0
+    n = len(audio) // TRIM_WINDOW * TRIM_WINDOW
+    windows = audio[:n].reshape(-1, TRIM_WINDOW)
+    energy = np.einsum("ij,ij->i", windows, windows)  # Per-window sum of squares
+    tail = audio[n:]
+    rms = float(np.sqrt((energy.sum(dtype=np.float64) + np.dot(tail, tail)) / len(audio)))
+    active = np.flatnonzero(energy > TRIM_LEVEL * TRIM_LEVEL * TRIM_WINDOW)
+    if len(active):
+        audio = audio[:(active[-1] + 1) * TRIM_WINDOW + TRIM_PAD]
+    return audio, rms
+
+
+def find_pause(audio: np.ndarray, force: bool = False) -> int | None:
+    """Return the sample index of the quietest 10ms window in the second half of the clip.
+
+    Returns None if even that window is above TRIM_LEVEL, i.e. there is no pause to cut
+    at, unless force is set (for noisy rooms, where the quietest point is still the best cut).
+    """
+    start = len(audio) // 2 // TRIM_WINDOW * TRIM_WINDOW
+    n = (len(audio) - start) // TRIM_WINDOW * TRIM_WINDOW
+    if n == 0:
+        return None
+    windows = audio[start:start + n].reshape(-1, TRIM_WINDOW)
+    energy = np.einsum("ij,ij->i", windows, windows)
+    quietest = int(np.argmin(energy))
+    if not force and energy[quietest] > TRIM_LEVEL * TRIM_LEVEL * TRIM_WINDOW:
+        return None
+    return start + quietest * TRIM_WINDOW + TRIM_WINDOW // 2
 
 
 # Key codes
@@ -64,61 +142,142 @@ KEY_LEFTMETA = 125  # Super/Windows key
 
 
 class AudioRecorder:
-    """Records audio from microphone to numpy array."""
+    """Records audio from microphone into a ring buffer."""
 
     def __init__(self, sample_rate: int = SAMPLE_RATE):
         self.sample_rate = sample_rate
+        # Capture at the device's native rate (queried in start(), since the default
+        # device can change) and resample on read, rather than relying on PortAudio to
+        # convert (or fail to open) at 16 kHz.
+        self.native_rate = sample_rate
         self.recording = False
-        self.audio_data: list[np.ndarray] = []
+        # Preallocated so the audio callback never allocates. Positions are absolute
+        # native-rate sample counts: pos is the write cursor, and samples before floor
+        # have been consumed (see release()) and may be overwritten.
+        # Samples stay int16 until read to halve the bytes moved per callback.
+        self.buffer = np.empty(self.native_rate * MAX_RECORD_SECONDS, dtype=np.int16)
+        self.pos = 0
+        self.floor = 0
+        self.overflowed = False
         self.stream = None
 
     def start(self):
         """Start recording audio."""
-        self.audio_data = []
+        native_rate = int(sd.query_devices(kind="input")["default_samplerate"])
+        if native_rate != self.native_rate:
+            self.native_rate = native_rate
+            self.buffer = np.empty(native_rate * MAX_RECORD_SECONDS, dtype=np.int16)
+        self.pos = 0
+        self.floor = 0
+        self.overflowed = False
         self.recording = True
         self.stream = sd.InputStream(
-            samplerate=self.sample_rate,
+            samplerate=self.native_rate,
             channels=CHANNELS,
-            dtype=np.float32,
+            dtype=np.int16,
             callback=self._audio_callback,
         )
         self.stream.start()
 
-    def stop(self) -> np.ndarray:
-        """Stop recording and return audio data."""
+    def stop(self):
+        """Stop recording; the recorded audio stays readable via get_since()."""
         self.recording = False
         if self.stream:
             self.stream.stop()
             self.stream.close()
             self.stream = None
-
-        if not self.audio_data:
-            return np.array([], dtype=np.float32)
-
-        return np.concatenate(self.audio_data).flatten()
+        if self.overflowed:
+            print(f"\nRecording buffer full, audio beyond {MAX_RECORD_SECONDS}s untranscribed was dropped.")
+            notify("Recording buffer full", f"Audio beyond {MAX_RECORD_SECONDS}s was dropped", urgency="low")
+
+    def release(self, pos: int):
+        """Mark audio before native-rate sample pos as consumed so it can be overwritten."""
+        self.floor = pos
+
+    def get_since(self, pos: int, end: int | None = None) -> np.ndarray:
+        """Return float32 audio in [-1, 1] at sample_rate, from native-rate sample pos.
+
+        Reads up to end, or to the write cursor, so it is safe to call while recording.
+        """
+        end = self.pos if end is None else end
+        size = self.buffer.size
+        start = pos % size
+        if start + (end - pos) <= size:
+            raw = self.buffer[start:start + end - pos]
+        else:
+            raw = np.concatenate((self.buffer[start:], self.buffer[:start + end - pos - size]))
+        # Convert and scale in a single ufunc pass.
+        audio = np.multiply(raw, 1.0 / 32768.0, dtype=np.float32)
+        if self.native_rate != self.sample_rate:
+            audio = soxr.resample(audio, self.native_rate, self.sample_rate)
+        return audio
 
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback for audio stream."""
-        if self.recording:
-            self.audio_data.append(indata.copy())
+        if not self.recording:
+            return
+        # Callbacks are serialized by PortAudio, so the cursor needs no lock.
+        # Audio that would overwrite unreleased samples is dropped.
+        size = self.buffer.size
+        n = min(frames, self.floor + size - self.pos)
+        if n < frames:
+            self.overflowed = True
+        start = self.pos % size
+        first = min(n, size - start)
+        self.buffer[start:start + first] = indata[:first, 0]
+        self.buffer[:n - first] = indata[first:n, 0]
+        self.pos += n
 
 
 class Transcriber:
     """Transcribes audio using faster-whisper."""
 
     def __init__(self, model_name: str = WHISPER_MODEL):
-        print(f"Loading Whisper model '{model_name}'...")
-        notify("lstt", f"Loading model '{model_name}'... (may download ~3GB)")
-        self.model = WhisperModel(model_name, device="cpu", compute_type="int8")
+        print(f"Loading Whisper model '{model_name}' (cpu, {COMPUTE_TYPE}, {CPU_THREADS} threads)...")
+        notify("lstt", f"Loading model '{model_name}'... (first launch downloads ~400MB)")
+        from faster_whisper import WhisperModel
+        self.model = WhisperModel(
+            model_name,
+            device="cpu",
+            compute_type=COMPUTE_TYPE,
+            cpu_threads=CPU_THREADS,
+            num_workers=1,
+        )
+        self._warm_up()
         print("Model loaded.")
         notify("lstt", "Model loaded. Ready!")
 
-    def transcribe(self, audio: np.ndarray, duration: float, on_segment=None) -> TranscriptionResult:
-        """Transcribe audio array to text with confidence info."""
+    def _warm_up(self):
+        """Run a dummy inference so the first real transcription isn't slow."""
+        try:
+            segments, _ = self.model.transcribe(
+                np.zeros(SAMPLE_RATE, dtype=np.float32),
+                beam_size=1,
+                language=LANGUAGE,
+                vad_filter=False,
+            )
+            list(segments)
+        except Exception as e:
+            print(f"Model warm-up failed: {e}")
+
+    def transcribe(self, audio: np.ndarray, duration: float, on_segment=None, prompt: str = "") -> TranscriptionResult:
+        """Transcribe audio array to text with confidence info.
+
+        prompt is the text of earlier chunks of the same recording, if any.
+        """
         if len(audio) == 0:
             return TranscriptionResult("", 0.0, 1.0, duration, datetime.now().strftime("%H:%M:%S"))
 
-        segments, _ = self.model.transcribe(audio, beam_size=5)
+        segments, _ = self.model.transcribe(
+            audio,
+            beam_size=BEAM_SIZE,
+            language=LANGUAGE,
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=300),
+            without_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=prompt or None,
+        )
         texts = []
         logprobs = []
         no_speech_probs = []
@@ -136,18 +295,77 @@ class Transcriber:
         return TranscriptionResult(text, avg_logprob, max_no_speech, duration, datetime.now().strftime("%H:%M:%S"))
 
 
+def _build_keymap() -> dict[str, tuple[int, bool]]:
+    """Map printable ASCII to (keycode, needs_shift) for a US keyboard layout."""
+    ecodes = evdev.ecodes.ecodes
+    keymap = {" ": (ecodes["KEY_SPACE"], False), "\n": (ecodes["KEY_ENTER"], False), "\t": (ecodes["KEY_TAB"], False)}
+    for c in "abcdefghijklmnopqrstuvwxyz":
+        keymap[c] = (ecodes[f"KEY_{c.upper()}"], False)
+        keymap[c.upper()] = (ecodes[f"KEY_{c.upper()}"], True)
+    for plain, shifted, name in zip(
+        "1234567890-=[]\\;',./`",
+        "!@#$%^&*()_+{}|:\"<>?~",
+        ["1", "2", "3", "4", "5", "6", "7", "8", "9", "0", "MINUS", "EQUAL", "LEFTBRACE", "RIGHTBRACE",
+         "BACKSLASH", "SEMICOLON", "APOSTROPHE", "COMMA", "DOT", "SLASH", "GRAVE"],
+    ):
+        keymap[plain] = (ecodes[f"KEY_{name}"], False)
+        keymap[shifted] = (ecodes[f"KEY_{name}"], True)
+    return keymap
+
+
 class TextTyper:
-    """Types text using ydotool."""
+    """Types text through an in-process uinput keyboard, falling back to ydotool."""
 
-    @staticmethod
-    def type_text(text: str):
+    # Pause per character so long texts don't overflow the compositor's evdev buffer
+    # (which drops events, leaving keys lost or stuck).
+    CHAR_DELAY = 0.002
+
+    def __init__(self):
+        self.keymap = _build_keymap()
+        try:
+            keys = {code for code, _ in self.keymap.values()} | {evdev.ecodes.KEY_LEFTSHIFT}
+            self.uinput = evdev.UInput({evdev.ecodes.EV_KEY: sorted(keys)}, name="lstt-typer")
+        except (evdev.UInputError, OSError) as e:
+            print(f"uinput unavailable ({e}), typing via ydotool.")
+            self.uinput = None
+
+    def type_text(self, text: str):
         """Type text at current cursor position."""
         if not text:
             return
 
+        # Characters outside the US layout (accents, smart quotes) go through ydotool.
+        if self.uinput and all(c in self.keymap for c in text):
+            self._type_uinput(text)
+        else:
+            self._type_ydotool(text)
+
+    def _type_uinput(self, text: str):
+        ui = self.uinput
+        shift = evdev.ecodes.KEY_LEFTSHIFT
+        for c in text:
+            code, shifted = self.keymap[c]
+            if shifted:
+                ui.write(evdev.ecodes.EV_KEY, shift, 1)
+            ui.write(evdev.ecodes.EV_KEY, code, 1)
+            ui.syn()
+            ui.write(evdev.ecodes.EV_KEY, code, 0)
+            if shifted:
+                ui.write(evdev.ecodes.EV_KEY, shift, 0)
+            ui.syn()
+            time.sleep(self.CHAR_DELAY)
+
+    def close(self):
+        """Release the uinput device."""
+        if self.uinput:
+            self.uinput.close()
+            self.uinput = None
+
+    @staticmethod
+    def _type_ydotool(text: str):
         try:
             subprocess.run(
-                ["ydotool", "type", "--", text],
+                ["ydotool", "type", "--key-delay", "0", "--", text],
                 check=True,
                 capture_output=True,
             )
@@ -164,8 +382,14 @@ class AudioDucker:
 
     def __init__(self):
         self.original_volume = None
+        self.duck_thread = None
 
     def duck(self):
+        """Duck the default sink in the background so the hotkey press isn't blocked."""
+        self.duck_thread = threading.Thread(target=self._duck, daemon=True)
+        self.duck_thread.start()
+
+    def _duck(self):
         try:
             result = subprocess.run(
                 ["wpctl", "get-volume", "@DEFAULT_AUDIO_SINK@"],
@@ -183,6 +407,10 @@ class AudioDucker:
             pass
 
     def restore(self):
+        # Wait for a pending duck so we never restore before it reads the volume.
+        if self.duck_thread:
+            self.duck_thread.join()
+            self.duck_thread = None
         if self.original_volume is None:
             return
         try:
@@ -216,6 +444,16 @@ class RecordingIndicator:
     """
 
     def __init__(self):
+        Gtk = load_gtk()
+        from gi.repository import Gdk
+
+        try:
+            gi.require_version("GtkLayerShell", "0.1")
+            from gi.repository import GtkLayerShell
+            has_layer_shell = GtkLayerShell.is_supported()
+        except (ValueError, ImportError):
+            has_layer_shell = False
+
         css_provider = Gtk.CssProvider()
         css_provider.load_from_data(self.CSS.encode())
         Gtk.StyleContext.add_provider_for_screen(
@@ -226,7 +464,7 @@ class RecordingIndicator:
 
         self.window = Gtk.Window()
 
-        if HAS_LAYER_SHELL:
+        if has_layer_shell:
             GtkLayerShell.init_for_window(self.window)
             GtkLayerShell.set_layer(self.window, GtkLayerShell.Layer.OVERLAY)
             GtkLayerShell.set_anchor(self.window, GtkLayerShell.Edge.TOP, True)
@@ -251,12 +489,13 @@ class RecordingIndicator:
         self.window.show_all()
         self.window.hide()
 
-    def show_recording(self):
-        GLib.idle_add(self._show_recording)
+    def show_recording(self, text=""):
+        GLib.idle_add(self._show_recording, text)
 
-    def _show_recording(self):
+    def _show_recording(self, text):
+        display = GLib.markup_escape_text(text) if text else "Recording..."
         self.label.set_markup(
-            '<span color="#ff4444">●</span>  Recording...'
+            f'<span color="#ff4444">●</span>  {display}'
         )
         self.window.show_all()
 
@@ -274,12 +513,27 @@ class RecordingIndicator:
         GLib.idle_add(self.window.hide)
 
 
+class NullIndicator:
+    """Stand-in for RecordingIndicator when running without a GUI."""
+
+    def show_recording(self, text=""):
+        pass
+
+    def show_transcribing(self, text=""):
+        pass
+
+    def hide(self):
+        pass
+
+
 class HotkeyMonitor:
     """Monitors for Ctrl+Super hotkey using evdev."""
 
-    def __init__(self, on_press, on_release):
+    def __init__(self, on_press, on_release, on_quit, on_error):
         self.on_press = on_press
         self.on_release = on_release
+        self.on_quit = on_quit
+        self.on_error = on_error
         self.ctrl_pressed = False
         self.meta_pressed = False
         self.combo_active = False
@@ -308,59 +562,85 @@ class HotkeyMonitor:
         if not self.devices:
             print("No keyboard devices found. Make sure you're in the 'input' group.")
             print("Run: sudo usermod -aG input $USER")
-            GLib.idle_add(Gtk.main_quit)
+            GLib.idle_add(self.on_quit)
             return
 
         print(f"Monitoring {len(self.devices)} keyboard device(s)")
         print("Hold Ctrl+Super to record, release to transcribe.")
         print("Press Ctrl+C to exit.\n")
 
+        # One epoll loop over every keyboard instead of a blocking thread per device.
+        selector = selectors.DefaultSelector()
         for device in self.devices:
-            t = threading.Thread(target=self._monitor_device, args=(device,), daemon=True)
-            t.start()
-
-    def _monitor_device(self, device: evdev.InputDevice):
-        """Monitor a single input device."""
-        try:
-            for event in device.read_loop():
-                if event.type != evdev.ecodes.EV_KEY:
+            selector.register(device.fd, selectors.EVENT_READ, device)
+
+        while selector.get_map():
+            for key, _ in selector.select():
+                device = key.data
+                try:
+                    events = list(device.read())
+                except BlockingIOError:
                     continue
+                except OSError:
+                    # Device disconnected
+                    selector.unregister(device.fd)
+                    continue
+                for event in events:
+                    # A failing callback must not end monitoring for every keyboard.
+                    try:
+                        self._handle_event(event)
+                    except Exception as e:
+                        self.on_error(e)
+
+    def _handle_event(self, event: evdev.InputEvent):
+        """Update modifier state from a single input event."""
+        if event.type != evdev.ecodes.EV_KEY:
+            return
 
-                key_event = evdev.categorize(event)
-
-                if event.code == KEY_LEFTCTRL:
-                    self.ctrl_pressed = key_event.keystate != 0
-                elif event.code == KEY_LEFTMETA:
-                    self.meta_pressed = key_event.keystate != 0
+        key_event = evdev.categorize(event)
 
-                # Check combo state
-                combo_now = self.ctrl_pressed and self.meta_pressed
+        if event.code == KEY_LEFTCTRL:
+            self.ctrl_pressed = key_event.keystate != 0
+        elif event.code == KEY_LEFTMETA:
+            self.meta_pressed = key_event.keystate != 0
 
-                if combo_now and not self.combo_active:
-                    self.combo_active = True
-                    self.on_press()
-                elif not combo_now and self.combo_active:
-                    self.combo_active = False
-                    self.on_release()
+        # Check combo state
+        combo_now = self.ctrl_pressed and self.meta_pressed
 
-        except OSError:
-            # Device disconnected
-            pass
+        if combo_now and not self.combo_active:
+            self.combo_active = True
+            self.on_press()
+        elif not combo_now and self.combo_active:
+            self.combo_active = False
+            self.on_release()
 
 
 class Lstt:
     """Main application class."""
 
-    def __init__(self):
+    def __init__(self, gui: bool = True):
+        # Without GTK, a plain GLib loop still services GLib.idle_add callbacks.
+        self.main_loop = None if gui else GLib.MainLoop()
         self.recorder = AudioRecorder()
         self.transcriber = Transcriber()
         self.typer = TextTyper()
-        self.indicator = RecordingIndicator()
+        self.indicator = RecordingIndicator() if gui else NullIndicator()
         self.ducker = AudioDucker()
         self.history: deque[TranscriptionResult] = deque(maxlen=8)
+        # Jobs are (session, audio, final): session collects the results of one
+        # recording's chunks, and final marks the recording's last chunk.
+        self.work_q: queue.Queue[tuple[list[TranscriptionResult], np.ndarray, bool]] = queue.Queue()
+        threading.Thread(target=self._worker, daemon=True).start()
+        # Guards the recording state shared by the hotkey and chunker threads.
+        self.chunk_lock = threading.Lock()
+        self.session: list[TranscriptionResult] = []
+        self.committed = 0  # Native-rate sample position up to which audio has been queued
+        self.chunks_queued = 0
         self.monitor = HotkeyMonitor(
             on_press=self._on_hotkey_press,
             on_release=self._on_hotkey_release,
+            on_quit=self.quit,
+            on_error=self._on_hotkey_error,
         )
 
     def _on_hotkey_press(self):
@@ -368,12 +648,50 @@ class Lstt:
         print("Recording...", end="", flush=True)
         self.ducker.duck()
         self.indicator.show_recording()
-        self.recorder.start()
+        with self.chunk_lock:
+            self.session = []
+            self.committed = 0
+            self.chunks_queued = 0
+            self.recorder.start()
+        threading.Thread(target=self._chunker, args=(self.session,), daemon=True).start()
+
+    def _chunker(self, session: list[TranscriptionResult]):
+        """Queue finished chunks for transcription while the hotkey is held.
+
+        Chunks are cut at a pause once CHUNK_SECONDS have built up (or forcibly at twice
+        that), so on release only the remaining tail still needs to be transcribed. No
+        chunk is cut while the worker is busy, so the pending audio grows into one
+        larger chunk instead of queueing up encoder passes.
+        """
+        rate = self.recorder.native_rate
+        chunk = int(CHUNK_SECONDS * rate)
+        while True:
+            time.sleep(CHUNK_POLL)
+            with self.chunk_lock:
+                if not self.recorder.recording or self.session is not session:
+                    return
+                end = self.recorder.pos
+                if end - self.committed < chunk or self.work_q.unfinished_tasks:
+                    continue
+                audio = self.recorder.get_since(self.committed, end)
+                cut = find_pause(audio, force=end - self.committed >= 2 * chunk)
+                if cut is None:
+                    continue
+                self.committed += cut * rate // SAMPLE_RATE
+                self.recorder.release(self.committed)
+                audio, rms = measure_and_trim(audio[:cut])
+                if rms >= MIN_RMS:
+                    self.work_q.put((session, audio, False))
+                    self.chunks_queued += 1
 
     def _on_hotkey_release(self):
         """Called when Ctrl+Super is released."""
-        audio = self.recorder.stop()
-        duration = len(audio) / SAMPLE_RATE
+        with self.chunk_lock:
+            if not self.recorder.recording:
+                return  # The press failed and was already cleaned up
+            self.recorder.stop()
+            session, committed, chunks_queued = self.session, self.committed, self.chunks_queued
+        duration = self.recorder.pos / self.recorder.native_rate
         print(f" {duration:.1f}s captured.")
 
         if duration < 0.3:
@@ -383,22 +701,84 @@ class Lstt:
             notify("Recording too short", "Skipped")
             return
 
-        print("Transcribing...", end="", flush=True)
-        self.indicator.show_transcribing()
-        result = self.transcriber.transcribe(
-            audio, duration, on_segment=self.indicator.show_transcribing
-        )
-        print(f" done.")
+        # Cheap energy gate so accidental taps never reach the encoder.
+        audio, rms = measure_and_trim(self.recorder.get_since(committed))
+        if rms < MIN_RMS:
+            if not chunks_queued:
+                print(f"Silent recording (RMS {rms:.4f}), skipping.")
+                self.ducker.restore()
+                self.indicator.hide()
+                notify("Silent", "Skipped")
+                return
+            audio = audio[:0]
+
+        self.ducker.restore()
+        self.indicator.show_transcribing(" ".join(r.text for r in session if r.text))
+        self.work_q.put((session, audio, True))
+
+    def _on_hotkey_error(self, error: Exception):
+        """Clean up after a press or release handler failed."""
+        print(f"\nHotkey handler error: {error!r}")
+        self.recorder.stop()
         self.ducker.restore()
         self.indicator.hide()
+        notify("lstt error", str(error), urgency="critical")
+
+    def _worker(self):
+        """Transcribe queued chunks off the hotkey thread."""
+        while True:
+            session, audio, final = self.work_q.get()
+            # One failed job must not take down the only worker (or leave the chunker
+            # waiting on unfinished_tasks forever).
+            try:
+                self._transcribe_job(session, audio, final)
+            except Exception as e:
+                print(f"\nTranscription error: {e!r}")
+                notify("Transcription failed", str(e), urgency="critical")
+                if not self.recorder.recording:
+                    self.indicator.hide()
+            finally:
+                self.work_q.task_done()
+
+    def _transcribe_job(self, session: list[TranscriptionResult], audio: np.ndarray, final: bool):
+        """Transcribe one chunk of a recording, finishing the recording on its final chunk."""
+        if final:
+            print("Transcribing...", end="", flush=True)
+        prompt = " ".join(r.text for r in session if r.text)
+        result = self.transcriber.transcribe(
+            audio, len(audio) / SAMPLE_RATE,
+            on_segment=lambda text: self._show_partial(session, final, f"{prompt} {text}".strip()),
+            prompt=prompt,
+        )
+        session.append(result)
+        if final:
+            print(f" done.")
+            GLib.idle_add(self._finish, TranscriptionResult.merge(session))
+
+    def _show_partial(self, session: list[TranscriptionResult], final: bool, text: str):
+        """Show partial text, but only while the indicator still belongs to this job.
+
+        A chunk of the recording being held shows on the recording indicator; a final
+        chunk shows as transcribing until a new recording takes the indicator over.
+        """
+        if session is not self.session or self.recorder.recording == final:
+            return
+        if final:
+            self.indicator.show_transcribing(text)
+        else:
+            self.indicator.show_recording(text)
+
+    def _finish(self, result: TranscriptionResult):
+        """Report and type a transcription result (runs on the GTK main thread)."""
+        if self.recorder.recording:
+            # A new recording started meanwhile; reset any text we left on its indicator.
+            self.indicator.show_recording()
+        else:
+            self.indicator.hide()
 
         if result.text:
             self.history.append(result)
-            low_confidence = (
-                result.avg_logprob < LOW_CONFIDENCE_LOGPROB
-                or result.no_speech_prob > HIGH_NO_SPEECH_PROB
-            )
-            if low_confidence:
+            if result.low_confidence:
                 print(f"Text (low confidence): {result.text}")
                 notify("Low confidence", result.text, urgency="low")
             else:
@@ -409,27 +789,42 @@ class Lstt:
         else:
             print("No speech detected.")
             notify("No speech detected", "")
+        return False
 
     def _print_history(self):
         """Print recent transcription history to console."""
         print(f"\n--- History ({len(self.history)}/8) ---")
-        for r in self.history:
-            confidence = "!" if r.avg_logprob < LOW_CONFIDENCE_LOGPROB or r.no_speech_prob > HIGH_NO_SPEECH_PROB else " "
-            print(f"  [{r.timestamp}] {confidence} ({r.duration:.1f}s) {r.text}")
+        print("\n".join(r.formatted for r in self.history))
         print()
 
     def run(self):
         """Run the application."""
-        # Hotkey monitor runs in background threads
+        # Hotkey monitor runs in a background thread
         threading.Thread(target=self.monitor.run, daemon=True).start()
-        # GTK main loop on the main thread
-        Gtk.main()
+        # GTK (or plain GLib) main loop on the main thread
+        if self.main_loop:
+            self.main_loop.run()
+        else:
+            load_gtk().main()
+
+    def quit(self):
+        """Stop the main loop."""
+        self.typer.close()
+        if self.main_loop:
+            self.main_loop.quit()
+        else:
+            load_gtk().main_quit()
 
 
 def main():
-    Gtk.init([])
-    signal.signal(signal.SIGINT, lambda *_: Gtk.main_quit())
-    app = Lstt()
+    parser = argparse.ArgumentParser(description="Push-to-talk speech transcription.")
+    parser.add_argument("--no-gui", action="store_true", help="run without the GTK recording indicator")
+    args = parser.parse_args()
+
+    if not args.no_gui:
+        load_gtk().init([])
+    app = Lstt(gui=not args.no_gui)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
     app.run()
 
 